@@ -23,5 +23,4 @@ class BalancingAlgorithm(OsmoAlgorithm):
     """ Very simple and eager balancing algorithm """
 
     def choose(self, history: OsmoHistory, choices: List[TestStep]) -> TestStep:
-        history_counts = [history.get_step_count(choice) for choice in choices]
-        return choices[history_counts.index(min(history_counts))]
+        return min(choices, key=history.get_step_count)
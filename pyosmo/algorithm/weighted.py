@@ -17,19 +17,22 @@ class WeightedBalancingAlgorithm(OsmoAlgorithm):
 
     def choose(self, history: OsmoHistory, choices: List[TestStep]) -> TestStep:
         weights = [c.weight for c in choices]
-        normalized_weights = [float(i) / max(weights) for i in weights]
+        max_weight = max(weights)
+        normalized_weights = [float(i) / max_weight for i in weights]
 
         history_counts = [history.get_step_count(choice) for choice in choices]
-        if max(history_counts) == 0:
+        max_count = max(history_counts)
+        if max_count == 0:
             return self.random.choices(choices, weights=normalized_weights)[0]
 
-        history_normalized_weights = [float(i) / max(history_counts) for i in history_counts]
+        history_normalized_weights = [float(i) / max_count for i in history_counts]
 
         total_weights = [a - b if a - b != 0 else 0.1 for (a, b) in zip(normalized_weights, history_normalized_weights)]
 
         # Make sure that total weight is more than zero
-        if sum(total_weights) < 0:
-            temp_add = (abs(sum(total_weights)) + 0.2) / len(total_weights)
+        total_weight = sum(total_weights)
+        if total_weight < 0:
+            temp_add = (abs(total_weight) + 0.2) / len(total_weights)
             total_weights = [temp_add + x for x in total_weights]
 
         return self.random.choices(choices, weights=total_weights)[0]
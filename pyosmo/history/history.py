@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime, timedelta
 
 from pyosmo.history.test_case import OsmoTestCaseRecord
@@ -9,6 +10,9 @@ class OsmoHistory:
 
     def __init__(self):
         self.test_cases = []
+        self._current_test_case = None
+        # Executed steps by step name over all test cases
+        self._step_counts = Counter()
         self.stop_time = None
         self.start_time = datetime.now()
 
@@ -17,7 +21,8 @@ class OsmoHistory:
         if self.current_test_case and self.current_test_case.is_running:
             self.current_test_case.stop()
         # Start a new test case
-        self.test_cases.append(OsmoTestCaseRecord())
+        self._current_test_case = OsmoTestCaseRecord()
+        self.test_cases.append(self._current_test_case)
 
     def stop(self) -> None:
         if self.stop_time:
@@ -28,9 +33,11 @@ class OsmoHistory:
 
     def add_step(self, step: TestStep, duration: timedelta, error: Exception = None):
         """ Add a step to the history """
-        if self.current_test_case is None:
+        test_case = self._current_test_case
+        if test_case is None:
             raise Exception("There is no active test case!!")
-        self.current_test_case.add_step(TestStepLog(step, duration, error))
+        test_case.add_step(TestStepLog(step, duration, error))
+        self._step_counts[step.name] += 1
 
     @property
     def error_count(self):
@@ -40,7 +47,7 @@ class OsmoHistory:
     @property
     def current_test_case(self) -> OsmoTestCaseRecord:
         """ The test case which is running or generating at the moment """
-        return self.test_cases[-1] if self.test_cases else None
+        return self._current_test_case
 
     @property
     def duration(self):
@@ -59,28 +66,16 @@ class OsmoHistory:
 
     def is_used(self, step: TestStep) -> bool:
         """ is used at least once """
-        for tc in self.test_cases:
-            if tc.is_used(step):
-                return True
-        return False
+        return self._step_counts[step.name] > 0
 
     def get_step_count(self, step: TestStep):
         """ Counts how many times the step is really called during whole history """
-        return sum((test_case.get_step_count(step) for test_case in self.test_cases))
+        return self._step_counts[step.name]
 
     @property
     def step_stats(self):
-        stats = {}
-        ret = ''
-        for test_case in self.test_cases:
-            for step in test_case.steps_log:
-                if step.name in stats:
-                    stats[step.name] = stats[step.name] + 1
-                else:
-                    stats[step.name] = 1
-        for key, value in stats.items():
-            ret += f'{key}:{value}\n'
-        return ret
+        stats = Counter(step.name for test_case in self.test_cases for step in test_case.steps_log)
+        return ''.join(f'{key}:{value}\n' for key, value in stats.items())
 
     def print_summary(self):
         if self.stop_time is None:
@@ -93,12 +88,10 @@ class OsmoHistory:
         print(ret)
 
     def __str__(self):
-        ret = ''
-        tc_index = 0
-        for test_case in self.test_cases:
-            tc_index += 1
-            ret += f'{tc_index}. test case {test_case.duration:.2f}s\n'
-            for step in test_case.steps_log:
-                ret += f'{step.timestamp} {step.duration:.2f}s {step.name}\n'
-            ret += '\n'
-        return ret
+        lines = []
+        for tc_index, test_case in enumerate(self.test_cases, 1):
+            lines.append(f'{tc_index}. test case {test_case.duration.total_seconds():.2f}s\n')
+            lines.extend(f'{step.timestamp} {step.duration.total_seconds():.2f}s {step.name}\n'
+                         for step in test_case.steps_log)
+            lines.append('\n')
+        return ''.join(lines)
@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime, timedelta
 
 from pyosmo.history.test_step_log import TestStepLog
@@ -5,8 +6,12 @@ from pyosmo.model import TestStep
 
 
 class OsmoTestCaseRecord:
+    __slots__ = ('steps_log', '_step_counts', '_start_time', '_stop_time')
+
     def __init__(self):
         self.steps_log = []
+        # Executed steps by step name
+        self._step_counts = Counter()
         self._start_time = None
         self._stop_time = None
         self._start_time = datetime.now()
@@ -24,6 +29,7 @@ class OsmoTestCaseRecord:
         if self.is_running():
             raise Exception("Test case is not running, cannot add more test steps!")
         self.steps_log.append(step_log)
+        self._step_counts[step_log.step.name] += 1
 
     @property
     def steps_count(self) -> int:
@@ -36,14 +42,11 @@ class OsmoTestCaseRecord:
 
     def is_used(self, step: TestStep) -> bool:
         """ is used at least once """
-        for sl in self.steps_log:
-            if sl.step.name == step.name:
-                return True
-        return False
+        return self._step_counts[step.name] > 0
 
     def get_step_count(self, step: TestStep) -> int:
         """ Counts how many times the step is really called during whole history """
-        return len(list(filter(lambda x: x.step.name == step.name is not None, self.steps_log)))
+        return self._step_counts[step.name]
 
     @property
     def start_time(self):
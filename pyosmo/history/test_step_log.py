@@ -5,6 +5,8 @@ from pyosmo.model import TestStep
 
 
 class TestStepLog:
+    __slots__ = ('_step', '_timestamp', '_duration', '_error')
+
     def __init__(self, step: TestStep, duration: timedelta, error: Exception = None):
         self._step = step
         self._timestamp = datetime.now()
@@ -1,11 +1,13 @@
 import logging
-from typing import List
+import sys
+from typing import List, Tuple
 
 logger = logging.getLogger('osmo')
 
 
 class ModelFunction:
     """ Generic function class containing basic functionality of model functions"""
+    __slots__ = ('function_name', 'object_instance')
 
     def __init__(self, function_name, object_instance):
         self.function_name = function_name
@@ -34,15 +36,18 @@ class ModelFunction:
 
 
 class TestStep(ModelFunction):
+    __slots__ = ('name', '_guard_function', '_weight_function')
 
-    def __init__(self, function_name, object_instance):
+    def __init__(self, function_name, object_instance, model_names=None):
         assert function_name.startswith('step_'), 'Wrong name function'
         super().__init__(function_name, object_instance)
-
-    @property
-    def name(self):
-        """ name means the part after 'step_' """
-        return self.function_name[5:]
+        # name means the part after 'step_', interned because it is used as history key
+        self.name = sys.intern(function_name[5:])
+        # Guard and weight functions are resolved once, those are evaluated on every step
+        if model_names is None:
+            model_names = set(dir(object_instance))
+        self._guard_function = self.return_function_if_exits(self.guard_name, model_names)
+        self._weight_function = self.return_function_if_exits(f'weight_{self.name}', model_names)
 
     @property
     def guard_name(self):
@@ -50,25 +55,28 @@ class TestStep(ModelFunction):
 
     @property
     def weight(self):
-        weight_function = self.return_function_if_exits(f'weight_{self.name}')
-        if weight_function is not None:
-            return float(weight_function.execute())
-        if 'weight' in dir(self.func):
-            return self.func.weight  # Noqa
+        if self._weight_function is not None:
+            return float(self._weight_function.execute())
+        func = self.func
+        if hasattr(func, 'weight'):
+            return func.weight  # Noqa
         return self.default_weight  # Default value
 
     @property
     def is_available(self):
         """ Check if step is available right now """
-        return True if self.guard_function is None else self.guard_function.execute()
+        guard_function = self._guard_function
+        return True if guard_function is None else guard_function.execute()
 
     @property
     def guard_function(self):
         """ return guard function if exists """
-        return self.return_function_if_exits(self.guard_name)
+        return self._guard_function
 
-    def return_function_if_exits(self, name):
-        if name in dir(self.object_instance):
+    def return_function_if_exits(self, name, model_names=None):
+        if model_names is None:
+            model_names = dir(self.object_instance)
+        if name in model_names:
             return ModelFunction(name, self.object_instance)
         return None
 
@@ -80,23 +88,38 @@ class OsmoModelCollector:
         # Format: functions[function_name] = link_of_instance
         self.sub_models = []
         self.debug = False
+        # dir() names of each sub model, function lookups are done against these instead of getattr
+        self._model_names = []
+        # Model functions and steps, cleared by reset_caches
+        self._functions_cache = {}
+        self._all_steps = None
+        self._steps_by_name = None
 
     @property
-    def all_steps(self) -> iter:
-        return (TestStep(f, sub_model) for sub_model in self.sub_models for f in dir(sub_model) if
-                hasattr(getattr(sub_model, f), '__call__') and f.startswith('step_'))
+    def all_steps(self) -> Tuple[TestStep, ...]:
+        if self._all_steps is None:
+            self._all_steps = tuple(TestStep(f, sub_model, names)
+                                    for sub_model, names in zip(self.sub_models, self._model_names)
+                                    for f in dir(sub_model)
+                                    if f.startswith('step_') and hasattr(getattr(sub_model, f), '__call__'))
+        return self._all_steps
 
     def get_step_by_name(self, name) -> TestStep:
         """ Get step by function name """
-        steps = (TestStep(f, sub_model) for sub_model in self.sub_models for f in dir(sub_model) if
-                 hasattr(getattr(sub_model, f), '__call__') and f == name)
-        for step in steps:
-            return step
-        return None  # noqa
-
-    def functions_by_name(self, name: str) -> iter:
-        return (ModelFunction(f, sub_model) for sub_model in self.sub_models for f in dir(sub_model) if
-                hasattr(getattr(sub_model, f), '__call__') and f == name)
+        if self._steps_by_name is None:
+            self._steps_by_name = {}
+            for step in self.all_steps:
+                # First model wins when several models have the same step
+                self._steps_by_name.setdefault(step.function_name, step)
+        return self._steps_by_name.get(name)
+
+    def functions_by_name(self, name: str) -> List[ModelFunction]:
+        functions = self._functions_cache.get(name)
+        if functions is None:
+            functions = [ModelFunction(name, sub_model) for sub_model, names in zip(self.sub_models, self._model_names)
+                         if name in names and hasattr(getattr(sub_model, name), '__call__')]
+            self._functions_cache[name] = functions
+        return functions
 
     def add_model(self, model):
         """ Add model for osmo """
@@ -107,15 +130,23 @@ class OsmoModelCollector:
             model = model()
 
         self.sub_models.append(model)
-        logger.debug(f'Loaded model: {model.__class__}')
+        self.reset_caches()
+        logger.debug('Loaded model: %s', model.__class__)
+
+    def reset_caches(self):
+        """ Scan the models again, functions may have been added or removed after the previous scan """
+        self._model_names = [set(dir(sub_model)) for sub_model in self.sub_models]
+        self._functions_cache.clear()
+        self._all_steps = None
+        self._steps_by_name = None
 
     def execute_optional(self, function_name) -> None:
         """ Execute all this name functions if available """
         for function in self.functions_by_name(function_name):
-            logger.debug(f'Execute: {function}')
+            logger.debug('Execute: %s', function)
             function.execute()
 
     @property
     def available_steps(self) -> List[TestStep]:
         """ Return iterator for all available steps """
-        return list(filter(lambda x: x.is_available, self.all_steps))
+        return [step for step in self.all_steps if step.is_available]
@@ -1,5 +1,8 @@
-import random
+import logging
 import time
+from random import Random
+
+logger = logging.getLogger('osmo')
 
 
 class RandomDelayModel:
@@ -14,8 +17,19 @@ class RandomDelayModel:
         """
         self.min = min_delay
         self.max = max_delay
+        self._random = Random()
+
+    @property
+    def osmo_random(self) -> Random:
+        return self._random
+
+    @osmo_random.setter
+    def osmo_random(self, value: Random):
+        """ Delays use own copy of osmo's random, so they follow the seed without changing the step selection """
+        self._random = Random()
+        self._random.setstate(value.getstate())
 
     def after(self):
-        delay = random.uniform(self.min, self.max)
-        print(f'Sleeping {delay}')
+        delay = self.osmo_random.uniform(self.min, self.max)
+        logger.info('Sleeping %s', delay)
         time.sleep(delay)
@@ -1,9 +1,11 @@
 # pylint: disable=bare-except,broad-except,too-many-instance-attributes
 import logging
-from datetime import datetime
+from datetime import timedelta
 from random import Random
+from time import perf_counter
 
 from pyosmo.config import OsmoConfig
+from pyosmo.end_conditions.length import Length
 from pyosmo.history.history import OsmoHistory
 from pyosmo.model import OsmoModelCollector, TestStep
 
@@ -28,7 +30,7 @@ class Osmo(OsmoConfig):
     @seed.setter
     def seed(self, value: int):
         """ Set test generation algorithm """
-        logger.debug(f'Set seed: {value}')
+        logger.debug('Set seed: %s', value)
         if not isinstance(value, int):
             raise AttributeError("config needs to be OsmoConfig.")
         self._seed = value
@@ -40,12 +42,12 @@ class Osmo(OsmoConfig):
     @staticmethod
     def _check_model(model: object):
         """ Check that model is valid"""
-        if not hasattr(model, '__class__'):
-            raise Exception("Osmo model need to be instance of model, not just class")
+        if isinstance(model, type):
+            raise TypeError("Osmo model need to be instance of model, not just class")
 
     def add_model(self, model: object):
         """ Add model for osmo """
-        logger.debug(f'Add model:{model}')
+        logger.debug('Add model: %s', model)
         self._check_model(model)
         # Set osmo_random
         model.osmo_random = self._random
@@ -57,14 +59,57 @@ class Osmo(OsmoConfig):
         :param step: Test step
         :return:
         """
-        logger.debug(f'Run step: {step}')
-        start_time = datetime.now()
+        logger.debug('Run step: %s', step)
+        start_time = perf_counter()
         try:
             step.execute()
-            self.history.add_step(step, datetime.now() - start_time)
         except Exception as error:
-            self.history.add_step(step, datetime.now() - start_time, error)
-            raise error
+            self.history.add_step(step, timedelta(seconds=perf_counter() - start_time), error)
+            raise
+        self.history.add_step(step, timedelta(seconds=perf_counter() - start_time))
+
+    def _run_test_case(self, test_length, before_hooks, after_hooks):
+        """
+        Run one test case until the test end condition is met
+        :param test_length: Step count of the test case or None when end condition decides it
+        :param before_hooks: Functions run before every step
+        :param after_hooks: Functions run after every step
+        :return:
+        """
+        # Bind per step lookups to locals, step loop is the hot path
+        history = self.history
+        model = self.model
+        choose = self.algorithm.choose
+        execute_optional = model.execute_optional
+        failure_in_test = self.test_error_strategy.failure_in_test
+        end_test = self.test_end_condition.end_test
+
+        history.start_new_test()
+        execute_optional('before_test')
+        steps_left = test_length
+        while True:
+            for hook in before_hooks:
+                hook.execute()
+            # Use algorithm to select the step
+            step = choose(history, model.available_steps)
+            step_name = step.name
+            execute_optional(f'pre_{step_name}')
+            try:
+                self._run_step(step)
+            except BaseException as error:
+                failure_in_test(history, model, error)
+            execute_optional(f'post_{step_name}')
+            for hook in after_hooks:
+                hook.execute()
+
+            if steps_left is None:
+                if end_test(history, model):
+                    break
+            else:
+                steps_left -= 1
+                if steps_left <= 0:
+                    break
+        execute_optional('after_test')
 
     def run(self):
         """ Same as generate but in online usage this sounds more natural"""
@@ -73,35 +118,34 @@ class Osmo(OsmoConfig):
     def generate(self):
         """ Generate / run tests """
         self.history = OsmoHistory()  # Restart the history
+        self.model.reset_caches()
         logger.debug('Start generation..')
-        logger.info(f'Using seed: {self.seed}')
+        logger.info('Using seed: %s', self.seed)
+        # Steps can be set up in before_suite, only a model without those is known to be empty here
+        if not self.model.all_steps and not self.model.functions_by_name('before_suite'):
+            raise Exception("Empty model!")
         # Initialize algorithm
         self.algorithm.initialize(self.random, self.model)
 
         self.model.execute_optional('before_suite')
+        # Pick up steps and hooks which were set up in before_suite
+        self.model.reset_caches()
         if not self.model.all_steps:
             raise Exception("Empty model!")
 
+        # Plain step count limit is tracked with a counter instead of asking history after every step.
+        # Exact type on purpose, subclasses of Length may override end_test
+        test_length = None
+        if type(self.test_end_condition) is Length:  # pylint: disable=unidiomatic-typecheck
+            test_length = self.test_end_condition.count
+
+        # General hooks which are run around every step
+        before_hooks = self.model.functions_by_name('before')
+        after_hooks = self.model.functions_by_name('after')
+
         while True:
             try:
-                self.history.start_new_test()
-                self.model.execute_optional('before_test')
-                while True:
-                    # Use algorithm to select the step
-                    self.model.execute_optional('before')
-                    step = self.algorithm.choose(self.history, self.model.available_steps)
-                    self.model.execute_optional(f'pre_{step}')
-                    try:
-                        self._run_step(step)
-                    except BaseException as error:
-                        self.test_error_strategy.failure_in_test(self.history, self.model, error)
-                    self.model.execute_optional(f'post_{step.name}')
-                    # General after step which is run after each step
-                    self.model.execute_optional('after')
-
-                    if self.test_end_condition.end_test(self.history, self.model):
-                        break
-                self.model.execute_optional('after_test')
+                self._run_test_case(test_length, before_hooks, after_hooks)
             except BaseException as error:
                 self.test_suite_error_strategy.failure_in_suite(self.history, self.model, error)
             if self.test_suite_end_condition.end_suite(self.history, self.model):
@@ -1,4 +1,4 @@
-# pylint: disable=bare-except,try-except-raise
+import pytest
 
 from pyosmo import Osmo
 from pyosmo.algorithm import RandomAlgorithm
@@ -24,26 +24,16 @@ def test_exception_raise_effects():
     osmo = Osmo(model)
     osmo.test_end_condition = Length(8)
     osmo.test_suite_end_condition = Length(1)
-    try:
+    # Osmo is raising test exception so need to catch it here
+    with pytest.raises(TempException):
         osmo.generate()
-    except TempException:
-        # Osmo is raisin test exception so need to catch it here
-        pass
     assert model.index == 5
 
 
 def test_wrong_config_objects():
     osmo = Osmo(OneStepModel())
-    try:
+    with pytest.raises(AttributeError):
         osmo.test_end_condition = RandomAlgorithm()
-    except AttributeError:
-        pass
-    except:
-        raise
 
-    try:
+    with pytest.raises(AttributeError):
         osmo.algorithm = Length(1)
-    except AttributeError:
-        pass
-    except:
-        raise
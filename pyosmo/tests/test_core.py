@@ -1,6 +1,9 @@
-# pylint: disable=bare-except
+import pytest
 
 from pyosmo import Osmo
+from pyosmo.algorithm import WeightedAlgorithm
+from pyosmo.end_conditions import Length
+from pyosmo.models import RandomDelayModel
 
 
 def test_empty_model():
@@ -8,15 +11,54 @@ def test_empty_model():
         def __init__(self):
             pass
 
-    exception = False
-    try:
-        osmo = Osmo(EmptyTestModel())
+    osmo = Osmo(EmptyTestModel())
+    with pytest.raises(Exception):
         osmo.generate()
-    except:
-        exception = True
 
-    if not exception:
-        raise Exception("Osmo did not except empty model")
+
+def test_empty_model_does_not_run_hooks():
+    class EmptyTestModel:
+        def __init__(self):
+            self.before_test_executed = False
+
+        def before_test(self):
+            self.before_test_executed = True
+
+    model = EmptyTestModel()
+    osmo = Osmo(model)
+    with pytest.raises(Exception, match='Empty model!'):
+        osmo.generate()
+    assert not model.before_test_executed
+
+
+def test_step_set_up_in_before_suite():
+    class TestModel:
+        def __init__(self):
+            self.step_count = 0
+            self.step_first = None
+
+        def before_suite(self):
+            self.step_first = self.first
+
+        def first(self):
+            self.step_count += 1
+
+    model = TestModel()
+    osmo = Osmo(model)
+    osmo.test_end_condition = Length(3)
+    osmo.test_suite_end_condition = Length(1)
+    osmo.generate()
+    assert model.step_count == 3
+
+
+def test_model_class_instead_of_instance():
+    class TestModel:
+        @staticmethod
+        def step_first():
+            pass
+
+    with pytest.raises(TypeError):
+        Osmo(TestModel)
 
 
 def test_step_without_guard():
@@ -86,3 +128,155 @@ def test_split_model_with_same_name_functions():
     osmo.generate()
     assert tm1.step_execute, "Osmo did not execute step in first model"
     assert tm2.step_execute, "Osmo did not execute step in second model"
+
+
+def test_hooks_of_added_model_are_executed():
+    class TestModel1:
+        def __init__(self):
+            self.after_count = 0
+
+        def step_first(self):
+            pass
+
+        def after(self):
+            self.after_count += 1
+
+    class TestModel2:
+        def __init__(self):
+            self.after_count = 0
+
+        def after(self):
+            self.after_count += 1
+
+    tm1 = TestModel1()
+    tm2 = TestModel2()
+    osmo = Osmo(tm1)
+    osmo.test_end_condition = Length(3)
+    osmo.test_suite_end_condition = Length(1)
+    osmo.generate()
+    osmo.add_model(tm2)
+    osmo.generate()
+    assert tm1.after_count == 6
+    assert tm2.after_count == 3
+
+
+def test_pre_and_post_step_hooks():
+    class TestModel:
+        def __init__(self):
+            self.calls = []
+
+        def pre_first(self):
+            self.calls.append('pre_first')
+
+        def step_first(self):
+            self.calls.append('step_first')
+
+        def post_first(self):
+            self.calls.append('post_first')
+
+    model = TestModel()
+    osmo = Osmo(model)
+    osmo.test_end_condition = Length(2)
+    osmo.test_suite_end_condition = Length(1)
+    osmo.generate()
+    assert model.calls == ['pre_first', 'step_first', 'post_first'] * 2
+
+
+def test_history_string_representation():
+    class TestModel:
+        @staticmethod
+        def step_first():
+            pass
+
+    osmo = Osmo(TestModel())
+    osmo.test_end_condition = Length(3)
+    osmo.test_suite_end_condition = Length(2)
+    osmo.generate()
+    lines = str(osmo.history).splitlines()
+    assert lines[0].startswith('1. test case ')
+    assert sum(1 for line in lines if line.endswith(' step_first')) == 6
+    assert osmo.history.step_stats == 'step_first:6\n'
+
+
+def test_step_added_to_model_class_later():
+    class TestModel:
+        @staticmethod
+        def step_first():
+            pass
+
+    osmo = Osmo(TestModel())
+    osmo.generate()
+    TestModel.step_second = staticmethod(lambda: None)
+    osmo = Osmo(TestModel())
+    osmo.generate()
+    assert {s.name for s in osmo.model.all_steps} == {'first', 'second'}
+
+
+def test_hook_added_between_runs():
+    class TestModel:
+        def __init__(self):
+            self.after_count = 0
+
+        @staticmethod
+        def step_first():
+            pass
+
+    model = TestModel()
+    osmo = Osmo(model)
+    osmo.test_end_condition = Length(3)
+    osmo.test_suite_end_condition = Length(1)
+    osmo.generate()
+
+    def after():
+        model.after_count += 1
+
+    setattr(model, 'after', after)
+    osmo.generate()
+    assert model.after_count == 3
+
+
+def test_proxy_model_without_hooks():
+    class ProxyModel:
+        weight = 1
+
+        def __init__(self):
+            self.calls = []
+
+        def __getattr__(self, name):
+            # Answers to every attribute, only functions listed in dir() are part of the model
+            return lambda: self.calls.append(name)
+
+        def step_first(self):
+            self.calls.append('step_first')
+
+    model = ProxyModel()
+    osmo = Osmo(model)
+    # Weight functions are looked up by the weighted algorithm
+    osmo.algorithm = WeightedAlgorithm()
+    osmo.test_end_condition = Length(2)
+    osmo.test_suite_end_condition = Length(1)
+    osmo.generate()
+    assert model.calls == ['step_first'] * 2
+
+
+def test_delay_model_does_not_change_step_selection():
+    class TestModel:
+        @staticmethod
+        def step_first():
+            pass
+
+        @staticmethod
+        def step_second():
+            pass
+
+    def generated_steps(*models):
+        osmo = Osmo()
+        for model in models:
+            osmo.add_model(model)
+        osmo.seed = 1234
+        osmo.test_end_condition = Length(20)
+        osmo.test_suite_end_condition = Length(1)
+        osmo.generate()
+        return [step.name for step in osmo.history.test_cases[0].steps_log]
+
+    assert generated_steps(TestModel()) == generated_steps(TestModel(), RandomDelayModel(0, 0))
@@ -1,6 +1,7 @@
 from datetime import datetime
 from datetime import timedelta
 
+import pytest
 from hypothesis import given
 from hypothesis.strategies import integers
 
@@ -19,16 +20,24 @@ class TempModel:
         self.counter += 1
 
 
-@given(steps=integers(1, 100), tests=integers(1, 10))
-def test_length_end_condition(steps, tests):
+@pytest.fixture(name='temp_model_osmo', scope='module')
+def fixture_temp_model_osmo():
+    """ Same osmo is reused between hypothesis examples, only end conditions change """
     model = TempModel()
-    osmo = Osmo(model)
+    return model, Osmo(model)
+
+
+@given(steps=integers(1, 100), tests=integers(1, 10))
+def test_length_end_condition(temp_model_osmo, steps, tests):
+    model, osmo = temp_model_osmo
+    model.counter = 0
     osmo.test_end_condition = Length(tests)
     osmo.test_suite_end_condition = Length(steps)
     osmo.generate()
     assert model.counter == steps * tests
 
 
+@pytest.mark.slow
 def test_test_time_end_condition():
     time_in_sec = 1
     osmo = Osmo(TempModel())
@@ -42,6 +51,7 @@ def test_test_time_end_condition():
     assert duration > timedelta(seconds=time_in_sec - 0.1)
 
 
+@pytest.mark.slow
 def test_test_suite_time_end_condition():
     time_in_sec = 1
     osmo = Osmo(TempModel())
@@ -1,4 +1,5 @@
-# pylint: disable=bare-except
+import pytest
+
 from pyosmo import Osmo
 from pyosmo.end_conditions import Length
 from pyosmo.error_strategy import AllowCount, AlwaysIgnore, AlwaysRaise
@@ -12,37 +13,40 @@ class JustFailModel:
         raise self.exception
 
 
-def test_always_raise():
-    osmo = Osmo(JustFailModel(AssertionError('Failing test_stop_on_failure')))
+@pytest.fixture(name='failing_osmo', scope='module')
+def fixture_failing_osmo():
+    """ Tests only change end conditions and error strategies, generate starts a new history """
+    return Osmo(JustFailModel(AssertionError('Failing test')))
+
+
+def test_always_raise(failing_osmo):
+    osmo = failing_osmo
     osmo.test_end_condition = Length(100)
     osmo.test_suite_end_condition = Length(100)
     osmo.test_error_strategy = AlwaysRaise()
     osmo.test_suite_error_strategy = AlwaysRaise()
-    try:
+    with pytest.raises(AssertionError):
         osmo.generate()
-    except AssertionError:
-        pass
     assert osmo.history.total_amount_of_steps == 1
 
 
-def test_always_ignore():
-    osmo = Osmo(JustFailModel(AssertionError('Failing test_always_ignore')))
-    osmo.test_end_condition = Length(100)
-    osmo.test_suite_end_condition = Length(10)
+def test_always_ignore(failing_osmo):
+    osmo = failing_osmo
+    osmo.test_end_condition = Length(5)
+    osmo.test_suite_end_condition = Length(3)
     osmo.test_error_strategy = AlwaysIgnore()
     osmo.test_suite_error_strategy = AlwaysIgnore()
     osmo.generate()
-    assert osmo.history.total_amount_of_steps == 10 * 100
+    assert osmo.history.total_amount_of_steps == 3 * 5
+    assert osmo.history.error_count == 3 * 5
 
 
-def test_allow_count():
-    osmo = Osmo(JustFailModel(AssertionError('Failing test_stop_on_failure')))
+def test_allow_count(failing_osmo):
+    osmo = failing_osmo
     osmo.test_end_condition = Length(10)
     osmo.test_suite_end_condition = Length(10)
     osmo.test_error_strategy = AllowCount(3)
     osmo.test_suite_error_strategy = AllowCount(3)
-    try:
+    with pytest.raises(AssertionError):
         osmo.generate()
-    except:
-        pass
     assert osmo.history.total_amount_of_steps == 3 + 1